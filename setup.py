@@ -30,6 +30,10 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "uvloop": ["uvloop>=0.17.0; sys_platform != 'win32'"],
+        "orjson": ["orjson>=3.6.0"],
+    },
     entry_points={
         "console_scripts": [
             "tui-youmusic=ytmusic_tui:main",
@@ -1,30 +1,140 @@
 from textual.app import App, ComposeResult
 from textual.widgets import Input, Static, ListView, ListItem, Header, Footer
 from textual.containers import Vertical, Horizontal
-from textual import events
+from textual import events, work
 from textual.binding import Binding
 
 from ytmusicapi import YTMusic
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
-import threading
+import shutil
 import os
+import sys
 import time
 import asyncio
 import signal
 import atexit
-import psutil
 import json
+import sqlite3
+import functools
+from collections import OrderedDict, deque
 from pathlib import Path
 
+# orjson is optional; it serializes state and cached results several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Byte patterns for spotting our mpv processes in /proc without decoding anything
+MPV_COMM = b"mpv\n"
+MPV_YOUTUBE_MARKER = b"youtube.com"
+MPV_NO_VIDEO_ARG = b"\0--no-video\0"  # cmdline args are NUL-terminated, so this matches the whole arg
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """Run a blocking call in the default executor so the UI keeps responding."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+def dump_json(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes, with orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def load_json(data):
+    """Parse JSON from bytes or str, with orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_duration(text):
+    """Convert a "m:ss" or "h:mm:ss" duration to seconds, or None if unknown."""
+    try:
+        seconds = 0
+        for part in text.split(":"):
+            seconds = seconds * 60 + int(part)
+        return seconds
+    except (AttributeError, ValueError):
+        return None
+
+
+def read_proc_file(path):
+    """Read a /proc file as bytes with plain os.read calls, skipping the buffered file layer."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        chunk = os.read(fd, 4096)
+        while chunk:
+            chunks.append(chunk)
+            chunk = os.read(fd, 4096)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def find_mpv_pids():
+    """Return pids of running mpv processes that look like ours (audio-only or playing YouTube)."""
+    if sys.platform.startswith("linux"):
+        # Read /proc directly: one small comm read per process, cmdline only for mpv
+        pids = []
+        for name in os.listdir("/proc"):
+            if not name.isdigit():
+                continue
+            try:
+                if read_proc_file(f"/proc/{name}/comm") != MPV_COMM:
+                    continue
+                cmdline = read_proc_file(f"/proc/{name}/cmdline")
+            except OSError:
+                continue  # Exited or not ours to read
+            if MPV_YOUTUBE_MARKER in cmdline or MPV_NO_VIDEO_ARG in cmdline:
+                pids.append(int(name))
+        return pids
+
+    # Elsewhere use psutil; raises ImportError for callers that have a fallback
+    import psutil
+
+    # name() is one cheap read per process; cmdline is read just for the few mpv processes
+    pids = []
+    for proc in psutil.process_iter():
+        try:
+            if proc.name() != 'mpv':
+                continue
+            if any('youtube.com' in arg or arg == '--no-video' for arg in proc.cmdline()):
+                pids.append(proc.pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return pids
+
+
+def iter_mpv_processes():
+    """Yield psutil handles for the mpv processes found by find_mpv_pids()."""
+    # Imported on first use; raises ImportError for callers that have a fallback
+    import psutil
+
+    for pid in find_mpv_pids():
+        try:
+            yield psutil.Process(pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
 
 class SongItem(ListItem):
     """Custom ListItem for displaying song information."""
     
     def __init__(self, title, artist, video_id, duration=None):
-        # Format the display text
-        duration_str = f" ({duration})" if duration else ""
-        display_text = f"🎵 {title} - {artist}{duration_str}"
-        super().__init__(Static(display_text))
+        # Format the display text once, in a single string build, and keep it for reuse
+        if duration:
+            self.display_text = f"🎵 {title} - {artist} ({duration})"
+        else:
+            self.display_text = f"🎵 {title} - {artist}"
+        super().__init__(Static(self.display_text))
         self.title = title
         self.artist = artist
         self.video_id = video_id
@@ -35,23 +145,33 @@ class RadioQueueItem(ListItem):
     """Custom ListItem for displaying radio queue songs."""
     
     def __init__(self, title, artist, video_id, duration=None, is_current=False):
-        # Format the display text with radio indicator
-        duration_str = f" ({duration})" if duration else ""
+        # Format the display text with radio indicator once, in a single string build
         prefix = "🎵 " if is_current else "   "
-        display_text = f"{prefix}{title} - {artist}{duration_str}"
-        super().__init__(Static(display_text))
+        if duration:
+            self.display_text = f"{prefix}{title} - {artist} ({duration})"
+        else:
+            self.display_text = f"{prefix}{title} - {artist}"
+        self.label = Static(self.display_text)
+        super().__init__(self.label)
         self.title = title
         self.artist = artist
         self.video_id = video_id
         self.duration = duration
         self.is_current = is_current
 
+    def mark_current(self) -> None:
+        """Switch this row to the now-playing indicator in place."""
+        if not self.is_current:
+            self.is_current = True
+            self.display_text = f"🎵 {self.display_text[3:]}"
+            self.label.update(self.display_text)
+
 
 class YTMusicTUI(App):
     """A Terminal User Interface for YouTube Music."""
     
-    # Class variable to track all mpv processes across instances
-    _active_processes = []
+    # Class variable to track all mpv processes across instances (a set: O(1) add/discard)
+    _active_processes = set()
     _cleanup_registered = False
     
     CSS = """
@@ -79,7 +199,7 @@ class YTMusicTUI(App):
     
     ListView {
         border: solid $primary;
-        height: auto;
+        height: 1fr;
     }
     
     #radio-queue {
@@ -118,8 +238,60 @@ class YTMusicTUI(App):
         self.current_process = None
         self.songs = []
 
+        # Whether an mpv we don't track may be playing (earlier session or a disconnect)
+        self.untracked_mpv_possible = True
+
+        # Absolute mpv path lets subprocess use posix_spawn instead of fork+exec
+        self.mpv_path = shutil.which("mpv") or "mpv"
+
+        # YouTube Music client, created in the background after mount
+        self.ytmusic = None
+        self.ytmusic_init_task = None
+        self.show_ready_status = False  # Set when mount left the "Initializing" message
+
         # State persistence
         self.state_file = Path.home() / ".ytmusic_tui_state.json"
+        self.last_saved_state = None
+
+        # Search result cache: (query, filter, limit) -> (fetched_at, results)
+        self.search_cache = OrderedDict()
+        self.search_cache_size = 128
+        self.search_cache_ttl = 120
+
+        # Radio playlist cache: (video_id, limit) -> (fetched_at, watch_playlist)
+        self.watch_cache = OrderedDict()
+        self.watch_cache_size = 64
+        self.watch_cache_ttl = 600
+
+        # On-disk search cache shared across sessions
+        cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        self.search_cache_db = cache_home / "tui-youmusic" / "search.sqlite"
+        self.search_cache_db_ttl = 86400
+
+        # In-flight search and duplicate-submit tracking
+        self.search_task = None
+        self.last_query = None
+        self.last_query_time = 0.0
+
+        # Paging state for the results currently shown
+        self.search_query = None
+        self.search_limit = 0
+        self.search_exhausted = True
+        self.search_more_task = None
+
+        # Prefetched direct audio URLs: video_id -> (stream_url, expires_at)
+        self.stream_urls = {}
+        self.prefetch_task = None
+
+        # Widget handles, looked up once in on_mount
+        self.status_widget = None
+        self.results_widget = None
+        self.search_input = None
+        self.radio_queue_widget = None
+        self.radio_panel = None
+
+        # Latest status message waiting for the next frame
+        self.pending_status = None
 
         # Resume functionality
         self.last_played_song = None
@@ -128,15 +300,17 @@ class YTMusicTUI(App):
         
         # Radio functionality
         self.radio_active = False
-        self.radio_queue = []
+        self.radio_queue = deque()  # popleft() on every advance is O(1)
         self.radio_current_song = None
         self.radio_original_song = None
-        self.radio_monitor_thread = None
+        self.playback_monitor_task = None
+        self.radio_refill_task = None
         self.radio_queue_visible = False
         self.stop_radio_monitoring = False
         
-        # Race condition prevention
-        self.radio_progression_lock = threading.Lock()
+        # Race condition prevention. Progression runs on the event loop only, so a
+        # plain flag checked and set between awaits is enough to stop double skips
+        self.playback_lock = None  # asyncio.Lock, created on the app's loop in on_mount
         self.manual_progression_happening = False
         
     @classmethod
@@ -165,7 +339,7 @@ class YTMusicTUI(App):
         """Kill all mpv processes started by this application."""
         try:
             # Kill processes we're tracking
-            for process in cls._active_processes:
+            for process in list(cls._active_processes):
                 try:
                     if process.poll() is None:  # Process is still running
                         process.terminate()
@@ -183,13 +357,10 @@ class YTMusicTUI(App):
             # Also kill any mpv processes that might be running (backup cleanup)
             try:
                 # Use psutil to find and kill mpv processes
-                for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+                import psutil
+                for proc in iter_mpv_processes():
                     try:
-                        if proc.info['name'] == 'mpv':
-                            # Check if it's likely our mpv process (playing youtube)
-                            cmdline = ' '.join(proc.info['cmdline'] or [])
-                            if 'youtube.com' in cmdline or '--no-video' in cmdline:
-                                proc.terminate()
+                        proc.terminate()
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         pass
             except ImportError:
@@ -204,7 +375,7 @@ class YTMusicTUI(App):
             # Don't let cleanup errors crash the cleanup
             pass
 
-    def save_state(self):
+    def save_state(self, force=False):
         """Save current radio state to file."""
         try:
             state = {
@@ -256,8 +427,16 @@ class YTMusicTUI(App):
                     'duration': self.last_played_song.duration
                 }
             
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            # Skip the write when only the timestamp would change
+            content = {key: value for key, value in state.items() if key != 'timestamp'}
+            if not force and content == self.last_saved_state:
+                return
+            
+            # Write beside the real file and rename over it so a crash can't leave it truncated
+            temp_file = self.state_file.with_suffix('.tmp')
+            temp_file.write_bytes(dump_json(state, indent=True))
+            os.replace(temp_file, self.state_file)
+            self.last_saved_state = content
                 
         except Exception as e:
             pass  # Don't crash on save errors
@@ -268,8 +447,7 @@ class YTMusicTUI(App):
             if not self.state_file.exists():
                 return False
                 
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            state = load_json(self.state_file.read_bytes())
             
             # Check if state is recent (within last 24 hours)
             if time.time() - state.get('timestamp', 0) > 86400:
@@ -280,7 +458,7 @@ class YTMusicTUI(App):
             self.radio_queue_visible = state.get('radio_queue_visible', False)
             
             # Restore radio queue
-            self.radio_queue = []
+            self.radio_queue.clear()
             for song_data in state.get('radio_queue', []):
                 song = SongItem(
                     song_data['title'],
@@ -327,19 +505,120 @@ class YTMusicTUI(App):
 
     def check_background_playback(self):
         """Check if mpv is still running in background."""
+        # Songs started by this session are known without scanning
+        if any(process.poll() is None for process in YTMusicTUI._active_processes):
+            return True
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    if proc.info['name'] == 'mpv':
-                        cmdline = ' '.join(proc.info['cmdline'] or [])
-                        if 'youtube.com' in cmdline or '--no-video' in cmdline:
-                            return True
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            return bool(find_mpv_pids())
         except ImportError:
             pass
         return False
 
+    def create_http_session(self):
+        """Build the pooled HTTP session shared by all YouTube Music requests."""
+        session = requests.Session()
+        # Keep TLS connections alive across searches and radio fetches, and
+        # retry transient connection failures and gateway errors. ytmusicapi
+        # sends its queries as POSTs, which urllib3 won't retry unless allowed;
+        # they only read data, so repeating one is safe.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            )
+        )
+        session.mount("https://", adapter)
+        return session
+
+    async def cached_search(self, query, filter="songs", limit=20):
+        """Search YouTube Music, reusing recent results for repeated queries."""
+        key = (query, filter, limit)
+        cached = self.search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.search_cache_ttl:
+            self.search_cache.move_to_end(key)
+            return cached[1]
+
+        # Fall back to results saved by a previous session before hitting the network
+        db_key = f"{filter}|{limit}|{query}"
+        results = await run_in_thread(self.load_disk_search, db_key)
+        if results is None:
+            # The HTTP request runs in a worker thread; the cache is only touched here
+            results = await run_in_thread(self.ytmusic.search, query, filter=filter, limit=limit)
+            if results:
+                await run_in_thread(self.store_disk_search, db_key, results)
+
+        self.search_cache[key] = (time.monotonic(), results)
+        self.search_cache.move_to_end(key)
+        while len(self.search_cache) > self.search_cache_size:
+            self.search_cache.popitem(last=False)
+        return results
+
+    async def cached_watch_playlist(self, video_id, limit=20):
+        """Get a song's radio playlist, reusing it if fetched recently."""
+        key = (video_id, limit)
+        cached = self.watch_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.watch_cache_ttl:
+            self.watch_cache.move_to_end(key)
+            return cached[1]
+
+        watch_playlist = await run_in_thread(self.ytmusic.get_watch_playlist, videoId=video_id, limit=limit)
+        if watch_playlist and watch_playlist.get('tracks'):
+            self.watch_cache[key] = (time.monotonic(), watch_playlist)
+            self.watch_cache.move_to_end(key)
+            while len(self.watch_cache) > self.watch_cache_size:
+                self.watch_cache.popitem(last=False)
+        return watch_playlist
+
+    def load_disk_search(self, key):
+        """Return fresh search results from the on-disk cache, or None."""
+        try:
+            conn = sqlite3.connect(self.search_cache_db)
+            try:
+                row = conn.execute(
+                    "SELECT fetched_at, results FROM search_cache WHERE key = ?", (key,)
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            # Missing database or table just means nothing is cached yet
+            return None
+        
+        if not row or time.time() - row[0] > self.search_cache_db_ttl:
+            return None
+        try:
+            return load_json(row[1])
+        except ValueError:
+            return None
+
+    def store_disk_search(self, key, results):
+        """Save search results to the on-disk cache and drop expired entries."""
+        try:
+            self.search_cache_db.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.search_cache_db)
+            try:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS search_cache "
+                        "(key TEXT PRIMARY KEY, fetched_at REAL, results TEXT)"
+                    )
+                    now = time.time()
+                    conn.execute(
+                        "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?)",
+                        (key, now, dump_json(results))
+                    )
+                    conn.execute(
+                        "DELETE FROM search_cache WHERE fetched_at < ?",
+                        (now - self.search_cache_db_ttl,)
+                    )
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError, TypeError, ValueError):
+            pass  # Caching is best effort; never fail a search over it
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header()
@@ -362,10 +641,20 @@ class YTMusicTUI(App):
 
     def on_mount(self) -> None:
         """Called when app starts."""
+        # Cache widgets that are touched on every search and status update
+        self.status_widget = self.query_one("#status", Static)
+        self.results_widget = self.query_one("#results", ListView)
+        self.search_input = self.query_one("#search-input", Input)
+        self.radio_queue_widget = self.query_one("#radio-queue", ListView)
+        self.radio_panel = self.query_one(".radio-panel")
+        
+        # Created here so it belongs to the running event loop (Python 3.8/3.9)
+        self.playback_lock = asyncio.Lock()
+        
+        # Build the YouTube Music client off the UI thread so the first frame isn't delayed
+        self.ytmusic_init_task = asyncio.create_task(self.init_ytmusic())
+
         try:
-            # Try to initialize YTMusic (will work without authentication)
-            self.ytmusic = YTMusic()
-            
             # Check if there's background playback and load state
             background_playback = self.check_background_playback()
             state_loaded = self.load_state()
@@ -373,7 +662,7 @@ class YTMusicTUI(App):
             if background_playback and state_loaded and self.radio_active:
                 # Show radio queue if state was restored
                 if self.radio_queue_visible:
-                    self.query_one(".radio-panel").display = True
+                    self.radio_panel.display = True
                     # Update the radio queue display after mounting is complete
                     self.call_after_refresh(self.update_radio_queue_display)
                 
@@ -384,28 +673,60 @@ class YTMusicTUI(App):
             elif background_playback:
                 self.update_status("🎵 Music playing in background. Use ^s to stop or search for new songs.")
             else:
-                self.update_status("Ready to search! Type your query and press Enter.")
+                self.update_status("⏳ Initializing YouTube Music...")
+                self.show_ready_status = True
                 
         except Exception as e:
             self.update_status(f"Error initializing YouTube Music: {str(e)}")
         
         # Focus the search input
-        self.query_one("#search-input", Input).focus()
+        self.search_input.focus()
         
         # Hide radio queue initially if no state was loaded
         if not (self.radio_active and self.radio_queue_visible):
-            self.query_one(".radio-panel").display = False
+            self.radio_panel.display = False
+
+    async def init_ytmusic(self) -> None:
+        """Create the YTMusic client in a worker thread."""
+        try:
+            # Works without authentication
+            self.ytmusic = await run_in_thread(YTMusic, requests_session=self.create_http_session())
+            # Keep the background-playback or resumed-radio message from on_mount
+            if self.show_ready_status:
+                self.update_status("Ready to search! Type your query and press Enter.")
+        except Exception as e:
+            self.update_status(f"Error initializing YouTube Music: {str(e)}")
+
+    async def wait_for_ytmusic(self) -> bool:
+        """Wait for the YTMusic client to finish initializing."""
+        if self.ytmusic is None and self.ytmusic_init_task:
+            if self.ytmusic_init_task.done():
+                # The last attempt failed; try again instead of needing a restart
+                self.update_status("⏳ Initializing YouTube Music...")
+                self.ytmusic_init_task = asyncio.create_task(self.init_ytmusic())
+            else:
+                self.update_status("⏳ Still initializing YouTube Music...")
+            # init_ytmusic reports its own error if this attempt fails too
+            await asyncio.shield(self.ytmusic_init_task)
+        return self.ytmusic is not None
 
     def update_status(self, message: str) -> None:
         """Update the status message."""
-        status_widget = self.query_one("#status", Static)
-        
         # Add radio status if active
         if self.radio_active and self.radio_current_song:
             radio_msg = f"📻 Radio: {self.radio_current_song.title}"
             message = f"{message} | {radio_msg}"
         
-        status_widget.update(f"📢 {message}")
+        # Coalesce bursts of updates into one repaint per frame
+        if self.pending_status is None:
+            self.set_timer(1 / 30, self.flush_status)
+        self.pending_status = f"📢 {message}"
+
+    def flush_status(self) -> None:
+        """Write the latest pending status message to the status bar."""
+        message, self.pending_status = self.pending_status, None
+        if message is not None:
+            self.status_widget.update(message)
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Called when user submits search query."""
@@ -413,128 +734,278 @@ class YTMusicTUI(App):
         if not query:
             self.update_status("Please enter a search query.")
             return
-        
+
+        # Ignore an accidental double submit of the same query
+        now = time.monotonic()
+        if query == self.last_query and now - self.last_query_time < 0.3:
+            return
+        self.last_query = query
+        self.last_query_time = now
+
+        # A newer query supersedes any search still waiting on the network
+        if self.search_task and not self.search_task.done():
+            self.search_task.cancel()
+
         self.update_status(f"Searching for: {query}...")
-        await self.perform_search(query)
+        self.search_task = asyncio.create_task(self.perform_search(query))
 
     async def perform_search(self, query: str) -> None:
         """Perform YouTube Music search."""
-        results_widget = self.query_one("#results", ListView)
+        results_widget = self.results_widget
         results_widget.clear()
         self.songs = []
 
+        # Stop paging the previous query's results
+        self.search_exhausted = True
+        if self.search_more_task and not self.search_more_task.done():
+            self.search_more_task.cancel()
+
         try:
+            # Ask for roughly a screenful; above one page (~20) ytmusicapi makes extra requests
+            limit = max(10, min(20, self.size.height - 6))
+
             # Search for songs
-            results = self.ytmusic.search(query, filter="songs", limit=20)
+            try:
+                if not await self.wait_for_ytmusic():
+                    return
+                results = await self.cached_search(query, filter="songs", limit=limit)
+            except asyncio.CancelledError:
+                # Superseded by a newer query, which owns the results list now
+                return
             
             if not results:
                 self.update_status("No results found. Try a different search term.")
                 return
 
-            for song in results:
-                title = song.get("title", "Unknown Title")
-                artist = "Unknown Artist"
-                
-                # Get artist name
-                if song.get("artists") and len(song["artists"]) > 0:
-                    artist = song["artists"][0]["name"]
-                
-                video_id = song.get("videoId")
-                duration = song.get("duration")
-                
-                if video_id:
-                    item = SongItem(title, artist, video_id, duration)
-                    results_widget.append(item)
-                    self.songs.append(item)
+            new_items = self.build_song_items(results[:limit])
+
+            # Mount all results in one batch instead of one layout pass per song
+            self.songs = new_items
+            if new_items:
+                results_widget.extend(new_items)
+
+            # Further pages are fetched as the user scrolls towards the end
+            self.search_query = query
+            self.search_limit = limit
+            self.search_exhausted = len(results) < limit
 
             if self.songs:
                 results_widget.index = 0
                 self.update_status(f"Found {len(self.songs)} songs. Use Tab and ↑↓ to navigate, Enter to play.")
+
+                # Resolve stream URLs for the top results while the user browses
+                if self.prefetch_task and not self.prefetch_task.done():
+                    self.prefetch_task.cancel()
+                self.prefetch_task = asyncio.create_task(self.prefetch_streams(self.songs[:5]))
             else:
                 self.update_status("No valid songs found in results.")
                 
         except Exception as e:
             self.update_status(f"Search error: {str(e)}")
 
+    def build_song_items(self, results, skip_ids=()) -> list:
+        """Turn raw search results into SongItems, skipping unplayable or listed ids."""
+        items = []
+        append = items.append
+        for song in results:
+            get = song.get
+            video_id = get("videoId")
+            if not video_id or video_id in skip_ids:
+                continue
+
+            # First listed artist, if any
+            artists = get("artists")
+            artist = artists[0]["name"] if artists else "Unknown Artist"
+
+            append(SongItem(get("title", "Unknown Title"), artist, video_id, get("duration")))
+        return items
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Load the next page of results when the cursor nears the end."""
+        if event.list_view is not self.results_widget or self.search_exhausted:
+            return
+        if self.search_more_task and not self.search_more_task.done():
+            return
+        index = event.list_view.index
+        if index is not None and index >= len(self.songs) - 3:
+            self.search_more_task = asyncio.create_task(self.fetch_more_results())
+
+    async def fetch_more_results(self) -> None:
+        """Append the next page of results for the current query."""
+        query = self.search_query
+        limit = self.search_limit + 20
+        try:
+            results = await self.cached_search(query, filter="songs", limit=limit)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            self.update_status(f"Search error: {str(e)}")
+            return
+
+        # A new search may have replaced the list while we waited
+        if query != self.search_query:
+            return
+
+        new_items = self.build_song_items(results, {song.video_id for song in self.songs})
+        self.search_limit = limit
+        self.search_exhausted = len(results) < limit or not new_items
+        if new_items:
+            self.songs.extend(new_items)
+            self.results_widget.extend(new_items)
+            self.update_status(f"Found {len(self.songs)} songs. Use Tab and ↑↓ to navigate, Enter to play.")
+
+    async def prefetch_streams(self, songs) -> None:
+        """Resolve direct audio URLs with yt-dlp so mpv can skip extraction."""
+        semaphore = asyncio.Semaphore(3)
+
+        async def resolve(song):
+            cached = self.stream_urls.get(song.video_id)
+            if cached and time.time() < cached[1]:
+                return
+            async with semaphore:
+                # An asyncio child process, so cancelling the prefetch can stop yt-dlp
+                # and it never holds a thread in the shared executor
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        "yt-dlp", "-f", "bestaudio", "--get-url",
+                        f"https://www.youtube.com/watch?v={song.video_id}",
+                        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+                    )
+                except OSError:
+                    return
+                try:
+                    stdout, _ = await asyncio.wait_for(process.communicate(), 30)
+                except asyncio.TimeoutError:
+                    return
+                finally:
+                    # Don't leave yt-dlp running when it hangs or a newer search cancels this one
+                    if process.returncode is None:
+                        try:
+                            process.kill()
+                        except ProcessLookupError:
+                            pass
+            lines = stdout.decode(errors="replace").split()
+            if process.returncode == 0 and lines:
+                now = time.time()
+                # Drop expired URLs so the cache only holds ones that can still be used
+                for video_id in [key for key, (_, expires_at) in self.stream_urls.items() if expires_at <= now]:
+                    del self.stream_urls[video_id]
+                # Signed stream URLs expire after a few hours; stay well inside that
+                self.stream_urls[song.video_id] = (lines[0], now + 1800)
+
+        await asyncio.gather(*(resolve(song) for song in songs))
+
+    def playback_url(self, video_id):
+        """Return the prefetched stream URL if still fresh, else the watch page."""
+        cached = self.stream_urls.get(video_id)
+        if cached and time.time() < cached[1]:
+            return cached[0]
+        return f"https://www.youtube.com/watch?v={video_id}"
+
     async def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Called when user selects a song from the list."""
         if event.item and hasattr(event.item, 'video_id'):
-            # Stop radio if user manually selects a song
+            # Stop radio (or one still starting) if user manually selects a song
+            self.cancel_radio_start()
             if self.radio_active:
                 await self.stop_radio()
             await self.play_song(event.item)
 
     async def play_song(self, song_item: SongItem, from_radio=False) -> None:
         """Play the selected song using mpv."""
-        try:
-            # Stop ALL existing music to prevent overlaps
-            await self.stop_all_existing_music()
+        # One song change at a time, so overlapping requests can't leave two mpvs playing
+        async with self.playback_lock:
+            try:
+                # Stop ALL existing music to prevent overlaps
+                await self.stop_all_existing_music()
             
-            url = f"https://www.youtube.com/watch?v={song_item.video_id}"
+                url = self.playback_url(song_item.video_id)
             
-            # Track the song for resume functionality
-            self.last_played_song = song_item
+                # Track the song for resume functionality
+                self.last_played_song = song_item
             
-            # Update current song reference
-            if from_radio:
-                self.radio_current_song = song_item
+                # Update current song reference
+                if from_radio:
+                    self.radio_current_song = song_item
             
-            self.update_status(f"🎵 Playing: {song_item.title} - {song_item.artist}")
+                self.update_status(f"🎵 Playing: {song_item.title} - {song_item.artist}")
             
-            # Start mpv in a separate thread to avoid blocking the UI
-            def play_with_mpv():
+                # Use mpv with audio-only and no terminal output. A plain Popen child is
+                # not owned by the event loop, so it keeps playing after the app exits.
+                # close_fds=False is safe (Python fds are non-inheritable) and keeps
+                # the spawn on the posix_spawn fast path.
                 try:
-                    # Use mpv with audio-only and no terminal output
                     self.current_process = subprocess.Popen([
-                        "mpv", 
+                        self.mpv_path, 
                         "--no-video", 
                         "--really-quiet",
                         "--no-terminal",
                         url
-                    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    
-                    # Track this process for cleanup
-                    YTMusicTUI._active_processes.append(self.current_process)
-                    
-                    # Wait for process and handle radio progression
-                    self.current_process.wait()
-                    
-                    # Remove from tracking when done
-                    try:
-                        YTMusicTUI._active_processes.remove(self.current_process)
-                    except ValueError:
-                        pass
-                    
-                    # Check if radio auto-progression should happen
-                    # Use lock to prevent race condition with manual progression
-                    with self.radio_progression_lock:
-                        should_auto_progress = (
-                            self.radio_active and 
-                            not self.stop_radio_monitoring and 
-                            from_radio and 
-                            not self.manual_progression_happening
-                        )
-                        
-                        if should_auto_progress:
-                            # Set flag to prevent other threads from progressing
-                            self.manual_progression_happening = True
-                            
-                            # Save state before playing next song
-                            self.call_from_thread(self.save_state)
-                            # Schedule next song
-                            self.call_from_thread(self.auto_play_next_radio_song)
-                        
+                    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False)
                 except Exception as e:
-                    self.call_from_thread(self.update_status, f"Playback error: {str(e)}")
+                    self.update_status(f"Playback error: {str(e)}")
+                    return
             
-            # Start playback in background thread
-            threading.Thread(target=play_with_mpv, daemon=True).start()
+                # Track this process for cleanup
+                YTMusicTUI._active_processes.add(self.current_process)
             
-            # Save state after starting playback
-            self.save_state()
+                # Wait for the song to end on the event loop instead of a blocking thread
+                # A prefetched stream URL gets one retry through the watch page if mpv rejects it
+                cached = self.stream_urls.get(song_item.video_id)
+                prefetched = cached is not None and cached[0] == url
+                self.playback_monitor_task = asyncio.create_task(
+                    self.monitor_playback(
+                        self.current_process, from_radio, parse_duration(song_item.duration),
+                        fallback_song=song_item if prefetched else None
+                    )
+                )
             
-        except Exception as e:
-            self.update_status(f"Error starting playback: {str(e)}")
+                # Save state after starting playback
+                self.save_state()
+            
+            except Exception as e:
+                self.update_status(f"Error starting playback: {str(e)}")
+
+    async def monitor_playback(self, process, from_radio, duration=None, fallback_song=None) -> None:
+        """Wait for an mpv process to exit and handle radio progression."""
+        started = time.monotonic()
+        # Poll rarely mid-song and tightly near the expected end, so radio advances promptly
+        expected_end = started + duration if duration else None
+        while process.poll() is None:
+            if expected_end is None:
+                interval = 0.5
+            else:
+                interval = min(2.0, max(0.2, (expected_end - time.monotonic()) / 4))
+            await asyncio.sleep(interval)
+        
+        # Remove from tracking when done
+        YTMusicTUI._active_processes.discard(process)
+        
+        # A process that was stopped or replaced must not advance the radio
+        if process is not self.current_process:
+            return
+        
+        # mpv failed straight away on a prefetched URL (e.g. it needed yt-dlp's headers):
+        # forget it and play the song again from the watch page
+        if fallback_song and process.returncode != 0 and time.monotonic() - started < 2:
+            self.stream_urls.pop(fallback_song.video_id, None)
+            await self.play_song(fallback_song, from_radio=from_radio)
+            return
+        
+        # Check if radio auto-progression should happen (not while a manual skip runs)
+        should_auto_progress = (
+            self.radio_active and 
+            not self.stop_radio_monitoring and 
+            from_radio and 
+            not self.manual_progression_happening
+        )
+        
+        if should_auto_progress:
+            # Set flag to prevent a manual skip from progressing as well
+            self.manual_progression_happening = True
+            # Save state before playing next song
+            self.save_state()
+            await self.auto_play_next_radio_song()
 
     async def stop_current_playback(self) -> None:
         """Disconnect from current playback (let it continue in background)."""
@@ -543,39 +1014,74 @@ class YTMusicTUI(App):
         
         if self.current_process:
             try:
-                # Remove from tracking list (disconnect, don't kill)
-                try:
-                    YTMusicTUI._active_processes.remove(self.current_process)
-                except ValueError:
-                    pass
+                # Remove from tracking (disconnect, don't kill)
+                YTMusicTUI._active_processes.discard(self.current_process)
                 
                 # Don't terminate the process - let it continue in background
                 self.current_process = None
+                self.untracked_mpv_possible = True
                 self.update_status("⏹️  Disconnected from playback. Music continues in background. Press 'p' to resume or ^s to stop.")
             except:
                 pass
 
-    async def stop_all_existing_music(self) -> None:
-        """Stop all existing music to prevent overlaps when starting new music."""
-        try:
-            # Stop current process if tracked
-            if self.current_process:
+    async def terminate_mpv_processes(self, timeout: float = 0.5, scan: bool = True) -> int:
+        """Terminate our mpv processes, killing any still alive after the timeout."""
+        procs = []
+        stopped = 0
+
+        # Stop current process if tracked
+        process = self.current_process
+        if process:
+            # Only a song that is still playing counts as stopped
+            if process.poll() is None:
+                stopped += 1
+            # Clear first so its monitor doesn't treat the exit as a song ending
+            self.current_process = None
+            try:
+                process.terminate()
                 try:
-                    self.current_process.terminate()
-                    self.current_process = None
-                except:
-                    pass
-            
-            # Kill all mpv processes to prevent overlaps
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+                    await run_in_thread(process.wait, timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    await run_in_thread(process.wait)
+            except Exception:
+                pass
+
+        if not scan:
+            return stopped
+
+        try:
+            import psutil
+        except ImportError:
+            return stopped
+
+        # Find any other mpv processes playing our streams; the scan reads /proc, so keep it off the UI thread
+        for proc in await run_in_thread(list, iter_mpv_processes()):
+            try:
+                proc.terminate()
+                procs.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        # Escalate to SIGKILL for anything that ignored SIGTERM
+        if procs:
+            _, alive = await run_in_thread(psutil.wait_procs, procs, timeout=timeout)
+            for proc in alive:
                 try:
-                    if proc.info['name'] == 'mpv':
-                        cmdline = ' '.join(proc.info['cmdline'] or [])
-                        if 'youtube.com' in cmdline or '--no-video' in cmdline:
-                            proc.terminate()
+                    proc.kill()
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     pass
-        except:
+
+        # Every mpv still playing from here on is one we start and track
+        self.untracked_mpv_possible = False
+        return stopped + len(procs)
+
+    async def stop_all_existing_music(self) -> None:
+        """Stop all existing music to prevent overlaps when starting new music."""
+        try:
+            # Only scan the process table while an untracked mpv may still be playing
+            await self.terminate_mpv_processes(scan=self.untracked_mpv_possible)
+        except Exception:
             pass  # Don't let this block new music from starting
 
     async def start_radio(self, song_item: SongItem = None) -> None:
@@ -584,7 +1090,7 @@ class YTMusicTUI(App):
             # Use provided song or try to get current playing song
             if not song_item:
                 # Get currently selected song from results
-                results_widget = self.query_one("#results", ListView)
+                results_widget = self.results_widget
                 if results_widget.highlighted_child:
                     song_item = results_widget.highlighted_child
                 else:
@@ -594,16 +1100,19 @@ class YTMusicTUI(App):
             self.update_status(f"🔄 Starting radio based on: {song_item.title}...")
             
             # Get radio playlist from YouTube Music
+            if not await self.wait_for_ytmusic():
+                return
             video_id = song_item.video_id
-            watch_playlist = self.ytmusic.get_watch_playlist(videoId=video_id, limit=20)
+            watch_playlist = await self.cached_watch_playlist(video_id, limit=20)
             
             if not watch_playlist or 'tracks' not in watch_playlist:
                 self.update_status("❌ Could not get radio playlist.")
                 return
             
-            # Clear and populate radio queue
-            self.radio_queue = []
-            radio_queue_widget = self.query_one("#radio-queue", ListView)
+            # Clear and populate radio queue; the panel is rebuilt in one batch below
+            self.cancel_radio_refill()
+            self.radio_queue.clear()
+            radio_queue_widget = self.radio_queue_widget
             radio_queue_widget.clear()
             
             # Add songs to radio queue
@@ -619,12 +1128,9 @@ class YTMusicTUI(App):
                     video_id = track['videoId']
                     duration = track.get('duration', {}).get('text', '')
                     
-                    radio_song = SongItem(title, artist, video_id, duration)
+                    # Queue entries double as the panel rows, so each song gets one widget
+                    radio_song = RadioQueueItem(title, artist, video_id, duration)
                     self.radio_queue.append(radio_song)
-                    
-                    # Add to UI
-                    queue_item = RadioQueueItem(title, artist, video_id, duration)
-                    radio_queue_widget.append(queue_item)
             
             # Set radio state
             self.radio_active = True
@@ -633,16 +1139,16 @@ class YTMusicTUI(App):
             self.stop_radio_monitoring = False
             
             # Show radio queue
-            self.query_one(".radio-panel").display = True
+            self.radio_panel.display = True
             self.radio_queue_visible = True
             
             # Start playing the first song in radio
             if self.radio_queue:
-                first_song = self.radio_queue.pop(0)
+                first_song = self.radio_queue.popleft()
                 await self.play_song(first_song, from_radio=True)
                 
-                # Update queue display
-                await self.update_radio_queue_display()
+                # Update queue display, mounting the freshly built queue rows
+                await self.update_radio_queue_display(reuse_queue_items=True)
             
             self.update_status(f"📻 Radio started! Queue: {len(self.radio_queue)} songs")
             
@@ -652,21 +1158,21 @@ class YTMusicTUI(App):
     async def stop_radio(self) -> None:
         """Stop radio mode."""
         # Reset progression flag
-        with self.radio_progression_lock:
-            self.manual_progression_happening = False
+        self.manual_progression_happening = False
             
         self.radio_active = False
-        self.radio_queue = []
+        self.radio_queue.clear()
         self.radio_current_song = None
         self.radio_original_song = None
         self.stop_radio_monitoring = True
+        self.cancel_radio_refill()
         
         # Clear radio queue display
-        radio_queue_widget = self.query_one("#radio-queue", ListView)
+        radio_queue_widget = self.radio_queue_widget
         radio_queue_widget.clear()
         
         # Hide radio queue panel
-        self.query_one(".radio-panel").display = False
+        self.radio_panel.display = False
         self.radio_queue_visible = False
         
         self.update_status("📻 Radio stopped.")
@@ -676,70 +1182,83 @@ class YTMusicTUI(App):
         if not self.radio_active or not self.radio_queue:
             return
         
-        # Use lock to prevent race condition with automatic progression
-        with self.radio_progression_lock:
-            if self.manual_progression_happening:
-                # Another progression is already happening
-                return
-            
-            # Set flag to prevent automatic progression
-            self.manual_progression_happening = True
+        # Another progression is already happening
+        if self.manual_progression_happening:
+            return
+        
+        # Set flag to prevent automatic progression
+        self.manual_progression_happening = True
         
         try:
-            # Check if we need to fetch more songs
+            # Top up the queue in the background while the next song starts
             if len(self.radio_queue) < 5:
-                await self.fetch_more_radio_songs()
+                self.schedule_radio_refill()
             
             # Play next song
             if self.radio_queue:
-                next_song = self.radio_queue.pop(0)
+                next_song = self.radio_queue.popleft()
                 await self.play_song(next_song, from_radio=True)
-                await self.update_radio_queue_display()
+                await self.advance_radio_queue_display()
                 # Save state after radio progression
                 self.save_state()
         finally:
             # Always clear the flag when done
-            with self.radio_progression_lock:
-                self.manual_progression_happening = False
+            self.manual_progression_happening = False
 
     async def auto_play_next_radio_song(self) -> None:
-        """Play the next song in radio queue (automatic progression from thread)."""
+        """Play the next song in radio queue (automatic progression when a song ends)."""
         if not self.radio_active or not self.radio_queue:
-            with self.radio_progression_lock:
-                self.manual_progression_happening = False
+            self.manual_progression_happening = False
             return
         
         try:
-            # Check if we need to fetch more songs
+            # Top up the queue in the background while the next song starts
             if len(self.radio_queue) < 5:
-                await self.fetch_more_radio_songs()
+                self.schedule_radio_refill()
             
             # Play next song
             if self.radio_queue:
-                next_song = self.radio_queue.pop(0)
+                next_song = self.radio_queue.popleft()
                 await self.play_song(next_song, from_radio=True)
-                await self.update_radio_queue_display()
+                await self.advance_radio_queue_display()
                 # Save state after radio progression
                 self.save_state()
         finally:
             # Always clear the flag when done
-            with self.radio_progression_lock:
-                self.manual_progression_happening = False
+            self.manual_progression_happening = False
+
+    def schedule_radio_refill(self) -> None:
+        """Start fetching more radio songs unless a fetch is already running."""
+        if self.radio_refill_task is None or self.radio_refill_task.done():
+            self.radio_refill_task = asyncio.create_task(self.fetch_more_radio_songs())
+
+    def cancel_radio_refill(self) -> None:
+        """Drop any in-flight radio refill so it can't fill a stopped or new queue."""
+        if self.radio_refill_task and not self.radio_refill_task.done():
+            self.radio_refill_task.cancel()
+        self.radio_refill_task = None
+
+    def cancel_radio_start(self) -> bool:
+        """Drop a radio that is still fetching its playlist so it can't start after a stop or new song."""
+        return bool(self.workers.cancel_group(self, "radio-start"))
 
     async def fetch_more_radio_songs(self) -> None:
         """Fetch more songs for radio queue when running low."""
         try:
-            if not self.radio_current_song:
+            if not self.radio_current_song or not await self.wait_for_ytmusic():
                 return
             
             # Get more songs based on current playing song
-            watch_playlist = self.ytmusic.get_watch_playlist(
-                videoId=self.radio_current_song.video_id, 
-                limit=15
-            )
+            watch_playlist = await self.cached_watch_playlist(self.radio_current_song.video_id, limit=15)
+            
+            # Radio may have been stopped while the request was in flight
+            if not self.radio_active:
+                return
             
             if watch_playlist and 'tracks' in watch_playlist:
-                radio_queue_widget = self.query_one("#radio-queue", ListView)
+                radio_queue_widget = self.radio_queue_widget
+                queue_items = []
+                queued_ids = {s.video_id for s in self.radio_queue}
                 
                 for track in watch_playlist['tracks'][:15]:
                     if track.get('videoId'):
@@ -754,24 +1273,48 @@ class YTMusicTUI(App):
                         duration = track.get('duration', {}).get('text', '')
                         
                         # Avoid duplicates
-                        if not any(s.video_id == video_id for s in self.radio_queue):
-                            radio_song = SongItem(title, artist, video_id, duration)
+                        if video_id not in queued_ids:
+                            queued_ids.add(video_id)
+                            # The same widget is the queue entry and its panel row
+                            radio_song = RadioQueueItem(title, artist, video_id, duration)
                             self.radio_queue.append(radio_song)
-                            
-                            # Add to UI
-                            queue_item = RadioQueueItem(title, artist, video_id, duration)
-                            radio_queue_widget.append(queue_item)
+                            queue_items.append(radio_song)
+                
+                # Mount the new rows in one batch
+                if queue_items:
+                    radio_queue_widget.extend(queue_items)
                 
         except Exception as e:
             self.update_status(f"Warning: Could not fetch more radio songs: {str(e)}")
 
-    async def update_radio_queue_display(self) -> None:
+    async def advance_radio_queue_display(self) -> None:
+        """Move the radio queue display on by one song without rebuilding it."""
+        if not self.radio_queue_visible:
+            return
+        
+        radio_queue_widget = self.radio_queue_widget
+        rows = list(radio_queue_widget.children)
+        
+        # Expect [finished song, new current song, rest of queue]; otherwise rebuild
+        if (
+            len(rows) != len(self.radio_queue) + 2
+            or not rows[0].is_current
+            or rows[1].video_id != self.radio_current_song.video_id
+        ):
+            await self.update_radio_queue_display()
+            return
+        
+        await rows[0].remove()
+        rows[1].mark_current()
+
+    async def update_radio_queue_display(self, reuse_queue_items: bool = False) -> None:
         """Update the radio queue display."""
         if not self.radio_queue_visible:
             return
         
-        radio_queue_widget = self.query_one("#radio-queue", ListView)
+        radio_queue_widget = self.radio_queue_widget
         radio_queue_widget.clear()
+        queue_items = []
         
         # Add current song at top (if radio is active)
         if self.radio_active and self.radio_current_song:
@@ -782,68 +1325,61 @@ class YTMusicTUI(App):
                 self.radio_current_song.duration,
                 is_current=True
             )
-            radio_queue_widget.append(current_item)
+            queue_items.append(current_item)
+        
+        # Add queue songs; rows that were mounted before get fresh widgets
+        if not reuse_queue_items:
+            self.radio_queue = deque(
+                RadioQueueItem(song.title, song.artist, song.video_id, song.duration)
+                for song in self.radio_queue
+            )
+        queue_items.extend(self.radio_queue)
         
-        # Add queue songs
-        for song in self.radio_queue:
-            queue_item = RadioQueueItem(song.title, song.artist, song.video_id, song.duration)
-            radio_queue_widget.append(queue_item)
+        # Mount the whole queue in one batch instead of one layout pass per row
+        if queue_items:
+            radio_queue_widget.extend(queue_items)
 
     def action_play_selected(self) -> None:
         """Action to play the currently selected song."""
-        results_widget = self.query_one("#results", ListView)
+        results_widget = self.results_widget
         if results_widget.highlighted_child:
             self.run_action("list_view.select")
 
     def action_focus_search(self) -> None:
         """Action to focus the search input."""
-        self.query_one("#search-input", Input).focus()
+        self.search_input.focus()
 
     async def action_stop_all_music(self) -> None:
         """Action to actually stop all music."""
         try:
-            # Reset progression flag first
-            with self.radio_progression_lock:
-                self.manual_progression_happening = False
+            # Reset progression flag first and drop any radio that is still starting
+            self.manual_progression_happening = False
+            self.cancel_radio_start()
                 
-            # Stop current process if tracked
-            if self.current_process:
-                try:
-                    self.current_process.terminate()
-                    self.current_process = None
-                except:
-                    pass
-            
-            # Kill all mpv processes
-            killed_count = 0
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    if proc.info['name'] == 'mpv':
-                        cmdline = ' '.join(proc.info['cmdline'] or [])
-                        if 'youtube.com' in cmdline or '--no-video' in cmdline:
-                            proc.terminate()
-                            killed_count += 1
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            # Stop the current song and every other mpv we started
+            async with self.playback_lock:
+                killed_count = await self.terminate_mpv_processes()
             
             # Clear radio state
             self.radio_active = False
-            self.radio_queue = []
+            self.radio_queue.clear()
             self.radio_current_song = None
             self.radio_original_song = None
             self.stop_radio_monitoring = True
+            self.cancel_radio_refill()
             
             # Clear radio queue display
-            radio_queue_widget = self.query_one("#radio-queue", ListView)
+            radio_queue_widget = self.radio_queue_widget
             radio_queue_widget.clear()
             
             # Hide radio queue panel
-            self.query_one(".radio-panel").display = False
+            self.radio_panel.display = False
             self.radio_queue_visible = False
             
-            # Clear saved state since music is stopped
+            # Clear saved state since music is stopped; the next save must write it again
             if self.state_file.exists():
                 self.state_file.unlink()
+            self.last_saved_state = None
             
             if killed_count > 0:
                 self.update_status(f"🛑 Stopped music. {killed_count} process(es) terminated.")
@@ -873,7 +1409,7 @@ class YTMusicTUI(App):
             
             # Show radio queue if it was visible
             if self.radio_queue_visible:
-                self.query_one(".radio-panel").display = True
+                self.radio_panel.display = True
                 await self.update_radio_queue_display()
             
             # Resume playing the song
@@ -884,6 +1420,7 @@ class YTMusicTUI(App):
             self.update_status(f"▶️  Resuming: {self.last_played_song.title} - {self.last_played_song.artist}")
             await self.play_song(self.last_played_song)
 
+    @work(exclusive=True, group="radio-start")
     async def action_start_radio(self) -> None:
         """Action to start radio based on current song."""
         if self.radio_active:
@@ -900,14 +1437,15 @@ class YTMusicTUI(App):
 
     async def action_stop_radio(self) -> None:
         """Action to stop radio mode."""
+        starting = self.cancel_radio_start()
         if not self.radio_active:
-            self.update_status("❌ Radio is not active.")
+            self.update_status("📻 Radio stopped." if starting else "❌ Radio is not active.")
             return
         await self.stop_radio()
 
     def action_toggle_radio_queue(self) -> None:
         """Action to toggle radio queue visibility."""
-        radio_panel = self.query_one(".radio-panel")
+        radio_panel = self.radio_panel
         if self.radio_queue_visible:
             radio_panel.display = False
             self.radio_queue_visible = False
@@ -919,8 +1457,8 @@ class YTMusicTUI(App):
 
     def action_quit(self) -> None:
         """Action to quit the application."""
-        # Save state before quitting so music can continue
-        self.save_state()
+        # Save state before quitting so music can continue (fresh timestamp for resume)
+        self.save_state(force=True)
         
         # Don't cleanup processes - let music continue in background
         self.update_status("👋 App closed. Music continues in background.")
@@ -930,10 +1468,8 @@ class YTMusicTUI(App):
 
 def main():
     """Main entry point for the application."""
-    # Check if mpv is installed
-    try:
-        subprocess.run(["mpv", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if mpv is installed (a PATH lookup; no need to spawn mpv itself)
+    if shutil.which("mpv") is None:
         print("❌ Error: mpv is not installed or not in PATH.")
         print("Please install mpv:")
         print("  Ubuntu/Debian: sudo apt install mpv")
@@ -941,6 +1477,13 @@ def main():
         print("  macOS: brew install mpv")
         exit(1)
     
+    # Use uvloop's faster event loop when it's installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     app = YTMusicTUI()
     app.run()
 